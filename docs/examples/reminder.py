@@ -1,22 +1,26 @@
 from __future__ import annotations
 
-import dateparser
+import time
 
 from datetime import datetime
 from dataclasses import dataclass, field
 
 from typing import Union, Optional, Mapping, Any, MutableMapping
 
-import dateparser
+from dateparser.date import DateDataParser
 
 from redisent import RedisEntry
+from redisent.utils import DATACLASS_SLOTS
 
+# Shared parser so the settings are only merged once rather than on every dateparser.parse() call
+_FUZZY_PARSER = DateDataParser(settings={'PREFER_DATES_FROM': 'future'})
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class FuzzyTime:
     provided_when: str = field()
 
-    created_time: datetime = field()
+    created_time: datetime = field(default_factory=datetime.now)
     resolved_time: datetime = field(init=False)
 
     @property
@@ -39,7 +43,7 @@ class FuzzyTime:
         return int(t_delta.total_seconds()) if t_delta else None
 
     def __post_init__(self) -> None:
-        res_time = dateparser.parse(self.provided_when, settings={'PREFER_DATES_FROM': 'future'})
+        res_time = _FUZZY_PARSER.get_date_data(self.provided_when).date_obj
         if not res_time:
             raise ValueError(f'Unable to resolve provided "when": {self.provided_when}')
 
@@ -56,10 +60,10 @@ class FuzzyTime:
 
     @classmethod
     def from_dict(cls, dict_mapping: Mapping[str, Any]) -> FuzzyTime:
-        return FuzzyTime(provided_when=dict_mapping['provided_when'], created_time=dict_mapping.get('created_time', None))
+        return FuzzyTime.build(dict_mapping['provided_when'], created_ts=dict_mapping.get('created_time', None))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Reminder(RedisEntry):
     member_id: str = field(default_factory=str)
     member_name: str = field(default_factory=str)
@@ -99,5 +103,5 @@ class Reminder(RedisEntry):
 
         self.redis_name = f'{self.member_id}:{self.trigger_ts}'
 
-        if self.trigger_dt < datetime.now():
+        if self.trigger_ts < time.time():
             self.is_complete = True
@@ -5,25 +5,118 @@ import sys
 
 import aioredis
 import logging
+import msgpack
 import pickle
 
 import redis
 import functools
+import operator
+import zlib
 
 from concurrent.futures.thread import ThreadPoolExecutor
-from contextlib import contextmanager, asynccontextmanager
-from typing import Callable
+from typing import Any, Callable, List, Optional, Sequence
 
 from redisent.errors import RedisError
 from redisent.utils import RedisPoolType
 
 logger = logging.getLogger(__name__)
 
+# First byte of any pickle written with protocol 2 or newer (the ``PROTO`` opcode), followed by the protocol number
+_PICKLE_PROTO = pickle.PROTO[0]
+
+# Protocol used whenever values are pickled. This is pinned rather than using ``pickle.HIGHEST_PROTOCOL`` since the values are
+# stored in a shared Redis instance and must stay readable by every client, including ones running older Python versions
+PICKLE_PROTOCOL = 5
+
+# Prefix for msgpack-encoded values. msgpack never emits 0xc1 and it is not a valid UTF-8 byte either, so it cannot be
+# mistaken for a pickle, a msgpack payload written by something else or a plain string
+MSGPACK_MAGIC = b'\xc1'
+
+# Prefix for zlib-compressed values (wrapping a msgpack or pickle encoded value). Like 0xc1, 0xc0 is not a valid UTF-8 byte and
+# is not a pickle opcode
+ZLIB_MAGIC = b'\xc0'
+
+# Encoded values at least this many bytes long are compressed with zlib (when it actually makes them smaller)
+COMPRESS_MIN_SIZE = 1024
+
 
 class RedisentHelper:
+    __slots__ = ('redis_pool', 'is_async', '_client')
+
     redis_pool: RedisPoolType
     is_async: bool
 
+    _client: Optional[redis.Redis]  #: Lazily-built ``redis.Redis`` client shared by blocking operations on ``redis_pool``
+
+    @staticmethod
+    def encode_value(value: Any) -> bytes:
+        """
+        Encode a value as ``bytes`` for storing in Redis
+
+        Values are packed with :py:mod:`msgpack` and prefixed with ``MSGPACK_MAGIC``. Anything ``msgpack`` cannot represent
+        exactly (i.e. tuples, ``datetime`` instances or other arbitrary objects) falls back to :py:func:`pickle.dumps`. Either way,
+        large results are then compressed using :py:func:`RedisentHelper.compress_value`.
+
+        :param value: the value to encode
+        """
+
+        try:
+            value_bytes = MSGPACK_MAGIC + msgpack.packb(value, use_bin_type=True, strict_types=True)
+        except (TypeError, ValueError, OverflowError):
+            value_bytes = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+
+        return RedisentHelper.compress_value(value_bytes)
+
+    @staticmethod
+    def compress_value(value_bytes: bytes) -> bytes:
+        """
+        Compress an encoded value using :py:func:`zlib.compress` (prefixed with ``ZLIB_MAGIC``) if it is at least ``COMPRESS_MIN_SIZE``
+        bytes long and compressing it actually saves space. Otherwise ``value_bytes`` is returned as-is.
+
+        :param value_bytes: the encoded value
+        """
+
+        if len(value_bytes) >= COMPRESS_MIN_SIZE:
+            compressed = zlib.compress(value_bytes, 1)
+
+            if len(compressed) + 1 < len(value_bytes):
+                return ZLIB_MAGIC + compressed
+
+        return value_bytes
+
+    @staticmethod
+    def decode_value(value_bytes: bytes) -> Any:
+        """
+        Decode a value previously encoded with :py:func:`RedisentHelper.encode_value`
+
+        Values prefixed with ``ZLIB_MAGIC`` are decompressed first. Then values prefixed with ``MSGPACK_MAGIC`` are unpacked with
+        :py:mod:`msgpack` and everything else is handed to :py:func:`pickle.loads`. Errors from any of these are propagated as-is.
+
+        :param value_bytes: the encoded value
+        """
+
+        if value_bytes[:1] == ZLIB_MAGIC:
+            value_bytes = zlib.decompress(memoryview(value_bytes)[1:])
+
+        if value_bytes[:1] == MSGPACK_MAGIC:
+            return msgpack.unpackb(memoryview(value_bytes)[1:], raw=False, strict_map_key=False)
+
+        return pickle.loads(value_bytes)
+
+    @staticmethod
+    def decode_values(values_bytes: Sequence[bytes]) -> List[Any]:
+        """
+        Decode a batch of values previously encoded with :py:func:`RedisentHelper.encode_value`
+
+        Each value is decoded on its own using :py:func:`RedisentHelper.decode_value` so that truncated values or trailing data in
+        any of them raise an error rather than spilling over into the next value.
+
+        :param values_bytes: sequence of encoded values
+        """
+
+        decode_value = RedisentHelper.decode_value
+        return [decode_value(value_bytes) for value_bytes in values_bytes]
+
     @staticmethod
     def handle_decode_attempt(res, use_encoding: str = None, decode_handler: Callable = None):
         """
@@ -36,23 +129,36 @@ class RedisentHelper:
         if not res:
             return res
 
-        def decode_value(value):
-            try:
-                return pickle.loads(value)
-            except pickle.PickleError:
-                if decode_handler:
-                    return decode_handler(value)
-                elif use_encoding:
-                    return value.decode(use_encoding)
+        decode_str = operator.methodcaller('decode', use_encoding) if use_encoding else None
 
-                return value
+        def decode_value(value):
+            if isinstance(value, (bytes, bytearray)) and len(value) > 1:
+                try:
+                    if value[:1] == MSGPACK_MAGIC:
+                        return msgpack.unpackb(memoryview(value)[1:], raw=False, strict_map_key=False)
+                    elif value[0] == _PICKLE_PROTO and value[1] <= pickle.HIGHEST_PROTOCOL:
+                        return pickle.loads(value)
+                    elif value[:1] == ZLIB_MAGIC:
+                        return RedisentHelper.decode_value(value)
+                except (ValueError, pickle.PickleError, zlib.error):
+                    pass
+
+            if decode_handler:
+                return decode_handler(value)
+            elif decode_str and hasattr(value, 'decode'):
+                return decode_str(value)
+
+            return value
 
         if isinstance(res, list):
-            res = [decode_value(ent) for ent in res]
+            res = list(map(decode_value, res))
         elif isinstance(res, dict):
-            res = {ent_name.decode(use_encoding) if use_encoding else ent_name: decode_value(ent_value) for ent_name, ent_value in res.items()}
-        elif use_encoding:
-            res = res.decode(use_encoding)
+            if decode_str:
+                res = {decode_str(ent_name): decode_value(ent_value) for ent_name, ent_value in res.items()}
+            else:
+                res = {ent_name: decode_value(ent_value) for ent_name, ent_value in res.items()}
+        elif decode_str:
+            res = decode_str(res)
 
         return res
 
@@ -74,19 +180,20 @@ class RedisentHelper:
         :param final_handler: final callback handler to invoke __after__ attempting to decode the result
         """
 
+        # Pick the handler once at decoration time rather than on every call
+        handle_res = first_handler or functools.partial(self.handle_decode_attempt, use_encoding=use_encoding, decode_handler=final_handler)
+
         def _outer_wrapper(func):
             if asyncio.iscoroutinefunction(func):
                 @functools.wraps(func)
                 async def _async_wrapper(*args, **kwargs):
-                    res = await func(*args, **kwargs)
-                    return first_handler(res) if first_handler else self.handle_decode_attempt(res, use_encoding, decode_handler=final_handler)
+                    return handle_res(await func(*args, **kwargs))
 
                 return _async_wrapper
             else:
                 @functools.wraps(func)
                 def _blocking_wrapper(*args, **kwargs):
-                    res = func(*args, **kwargs)
-                    return first_handler(res) if first_handler else self.handle_decode_attempt(res, use_encoding, decode_handler=final_handler)
+                    return handle_res(func(*args, **kwargs))
 
                 return _blocking_wrapper
 
@@ -136,6 +243,7 @@ class RedisentHelper:
 
         self.redis_pool = redis_pool
         self.is_async = is_async
+        self._client = None
 
     @classmethod
     def build_pool_sync(cls, redis_uri: str) -> redis.ConnectionPool:
@@ -168,33 +276,76 @@ class RedisentHelper:
         return await aioredis.create_redis_pool(redis_uri)
 
     # Context managers for wrapped_redis helper
-    @asynccontextmanager
-    async def wrapped_redis_async(self, op_name: str = None):
-        op_name = op_name or 'N/A'
+    def wrapped_redis_async(self, op_name: str = None) -> _WrappedRedisAsync:
+        return _WrappedRedisAsync(self, op_name or 'N/A')
 
-        try:
-            logger.debug(f'Executing Async Redis command for "{op_name}"...')
-            yield self.redis_pool
-        except Exception as ex:
-            logger.exception(f'Encountered Redis Error running "{op_name}": {ex}')
-            raise RedisError(f'Redis Error executing "{op_name}": {ex}', base_exception=ex, related_command=op_name)
+    def wrapped_redis_sync(self, op_name: str = None) -> _WrappedRedisSync:
+        return _WrappedRedisSync(self, op_name or 'N/A')
+
+    wrapped_redis = property(fget=lambda self: self.wrapped_redis_async if self.is_async else self.wrapped_redis_sync)
+
+
+class _WrappedRedisAsync:
+    """
+    Asynchronous context manager returned by :py:func:`RedisentHelper.wrapped_redis_async`
+
+    Entering yields the helper's ``aioredis`` pool and any :py:exc:`Exception` raised within the block is logged and re-raised
+    as a :py:exc:`redisent.errors.RedisError`. This is a plain class rather than an :py:func:`contextlib.asynccontextmanager` to
+    avoid the generator machinery on every Redis call.
+    """
 
-    @contextmanager
-    def wrapped_redis_sync(self, op_name: str = None):
-        op_name = op_name or 'N/A'
+    __slots__ = ('helper', 'op_name')
+
+    def __init__(self, helper: RedisentHelper, op_name: str) -> None:
+        self.helper = helper
+        self.op_name = op_name
+
+    async def __aenter__(self):
+        # Pass ``op_name`` as an argument so the message is only formatted if debug logging is enabled
+        logger.debug('Executing Async Redis command for "%s"...', self.op_name)
+        return self.helper.redis_pool
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if isinstance(exc_val, Exception):
+            logger.exception(f'Encountered Redis Error running "{self.op_name}": {exc_val}', exc_info=exc_val)
+            raise RedisError(f'Redis Error executing "{self.op_name}": {exc_val}', base_exception=exc_val, related_command=self.op_name)
+
+        return False
+
+
+class _WrappedRedisSync:
+    """
+    Blocking context manager returned by :py:func:`RedisentHelper.wrapped_redis_sync`
+
+    Entering yields the helper's (lazily built) ``redis.Redis`` client and any :py:exc:`Exception` raised within the block is logged
+    and re-raised as a :py:exc:`redisent.errors.RedisError`. This is a plain class rather than a :py:func:`contextlib.contextmanager`
+    to avoid the generator machinery on every Redis call.
+    """
+
+    __slots__ = ('helper', 'op_name')
+
+    def __init__(self, helper: RedisentHelper, op_name: str) -> None:
+        self.helper = helper
+        self.op_name = op_name
+
+    def __enter__(self) -> redis.Redis:
+        helper = self.helper
 
         try:
-            r_conn = redis.Redis(connection_pool=self.redis_pool)
+            if helper._client is None:
+                helper._client = redis.Redis(connection_pool=helper.redis_pool)
+
+            return helper._client
         except Exception as ex:
-            err_message = f'Unable to build new Redis connection for "{op_name}": {ex}'
+            err_message = f'Unable to build new Redis connection for "{self.op_name}": {ex}'
             logger.exception(err_message)
             raise RedisError(err_message, base_exception=ex)
 
-        try:
-            yield r_conn
-        except Exception as ex:
-            err_message = f'Error executing Redis command "{op_name}": {ex}'
-            logger.exception(err_message)
-            raise RedisError(err_message, base_exception=ex, related_command=op_name)
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if isinstance(exc_val, Exception):
+            err_message = f'Error executing Redis command "{self.op_name}": {exc_val}'
+            logger.exception(err_message, exc_info=exc_val)
+            raise RedisError(err_message, base_exception=exc_val, related_command=self.op_name)
+
+        return False
 
-    wrapped_redis = property(fget=lambda self: self.wrapped_redis_async if self.is_async else self.wrapped_redis_sync)
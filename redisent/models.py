@@ -1,19 +1,68 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
+import itertools
 import logging
 import pickle
 
-from dataclasses import is_dataclass, dataclass, field, fields, asdict
-from typing import Mapping, Any, List, Optional, MutableMapping
+from dataclasses import is_dataclass, dataclass, field, fields
+from typing import Mapping, Any, Dict, List, Optional, MutableMapping, Iterable, Sequence, Tuple
 
 from redisent import RedisentHelper
+from redisent.helpers import PICKLE_PROTOCOL
 from redisent.errors import RedisError
+from redisent.utils import DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# ``COUNT`` hint used when scanning a hashmap with ``hscan`` (Redis defaults to 10, costing a round-trip per 10 or so entries)
+HSCAN_COUNT = 1000
 
-@dataclass()
+
+@functools.lru_cache(maxsize=None)
+def _entry_field_names(entry_cls: type, include_redis_fields: bool, include_internal_fields: bool) -> Tuple[str, ...]:
+    """
+    Build (and cache) the tuple of field names for a :py:class:`RedisEntry` subclass based on the provided filtering attributes
+
+    The fields of a dataclass are fixed once it is defined so the result is cached per class and combination of flags.
+    """
+
+    flds = []
+
+    for fld in fields(entry_cls):
+        is_redis_fld = fld.metadata.get('redis_field', False)
+        is_int_fld = fld.metadata.get('internal_field', False)
+
+        if is_redis_fld and not include_redis_fields:
+            continue
+
+        if is_int_fld and not include_internal_fields:
+            continue
+
+        flds.append(fld.name)
+
+    return tuple(flds)
+
+
+@functools.lru_cache(maxsize=None)
+def _entry_init_names(entry_cls: type) -> Optional[Tuple[str, ...]]:
+    """
+    Build (and cache) the ordered names of the positional ``__init__`` arguments for a :py:class:`RedisEntry` subclass
+
+    Returns ``None`` if the generated ``__init__`` has any keyword-only arguments, in which case entries must be built using keywords.
+    """
+
+    init_params = list(inspect.signature(entry_cls.__init__).parameters.values())[1:]
+
+    if any(param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD for param in init_params):
+        return None
+
+    return tuple(param.name for param in init_params)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RedisEntry:
     """
     Base dataclass that should be inherited from with additional :py:func:`dataclasses.field` s for each attribute the entry
@@ -22,6 +71,9 @@ class RedisEntry:
     All ``RedisEntry`` instances must define a unique-to-Redis value for ``redis_id``. If the entry is going to be stored as a hash-map,
     the class must also define a value for ``redis_name``.
 
+    On Python 3.10+ the dataclass is built with ``slots=True``; subclasses should also use ``@dataclass(**DATACLASS_SLOTS)`` (from
+    :py:mod:`redisent.utils`) to avoid a per-instance ``__dict__``.
+
     If the ``redis_name`` attribute is set, at a high level, the storing and fetching of values looks like this:
 
     .. code-block:: ipython
@@ -68,40 +120,25 @@ class RedisEntry:
         Helper for dumping a textual representation of a particular :py:class:`redisent.models.RedisEntry` instance
         """
 
-        dump_out = f'RedisEntry ({type(self).__name__}) for key "{self.redis_id}"'
+        dump_hdr = f'RedisEntry ({type(self).__name__}) for key "{self.redis_id}"'
 
         if self.redis_name:
-            dump_out = f'{dump_out}, hash entry "{self.redis_name}":'
+            dump_hdr = f'{dump_hdr}, hash entry "{self.redis_name}":'
 
-        for attr in self.get_entry_fields(include_redis_fields=False, include_internal_fields=False):
-            dump_out = f'{dump_out}\n=> {attr}\t-> "{getattr(self, attr)}"'
-
-        return dump_out
+        return '\n'.join([dump_hdr, *(f'=> {attr}\t-> "{getattr(self, attr)}"' for attr in _entry_field_names(type(self), False, False))])
 
     @classmethod
     def get_entry_fields(cls, include_redis_fields: bool = False, include_internal_fields: bool = False) -> List[str]:
         """
         Class method used for building a list of strings for each field name, based on the provided filering attributes
 
+        The field names are only walked once per class (and combination of flags), a new list is returned on each call.
+
         :param include_redis_fields: if set, include fields with metadata indicating they are Redis-related fields (i.e. ``redis_id`` or ``redis_name``)
         :param include_internal_fields: if set, include internal fields which are used by ``redisent`` only (any marked with metadata attribute ``internal_field``)
         """
 
-        flds = []
-
-        for fld in fields(cls):
-            is_redis_fld = fld.metadata.get('redis_field', False)
-            is_int_fld = fld.metadata.get('internal_field', False)
-
-            if is_redis_fld and not include_redis_fields:
-                continue
-
-            if is_int_fld and not include_internal_fields:
-                continue
-
-            flds.append(fld.name)
-
-        return flds
+        return list(_entry_field_names(cls, include_redis_fields, include_internal_fields))
 
     @property
     def entry_fields(self) -> List[str]:
@@ -138,7 +175,21 @@ class RedisEntry:
             if 'redis_name' in ent_kwargs:
                 redis_name = ent_kwargs.pop('redis_name')
 
-        cls_kwargs: MutableMapping[str, Any] = {attr: ent_kwargs[attr] for attr in cls.get_entry_fields(include_redis_fields=False, include_internal_fields=False) if attr in ent_kwargs}
+        init_names = _entry_init_names(cls) if redis_name else None
+
+        if init_names:
+            # Fast path: every argument is available (i.e. a decoded hashmap entry) so build the entry positionally
+            ent_kwargs['redis_id'] = redis_id
+            ent_kwargs['redis_name'] = redis_name
+
+            try:
+                init_args = [ent_kwargs[attr] for attr in init_names]
+            except KeyError:
+                pass
+            else:
+                return cls(*init_args)
+
+        cls_kwargs: MutableMapping[str, Any] = {attr: ent_kwargs[attr] for attr in _entry_field_names(cls, False, False) if attr in ent_kwargs}
         # noinspection PyArgumentList
 
         cls_kwargs['redis_id'] = redis_id
@@ -149,8 +200,10 @@ class RedisEntry:
 
     def as_dict(self, include_redis_fields: bool = True, include_internal_fields: bool = False) -> Mapping[str, Any]:
         """
-        Return a mapping representing this entry by making use of :py:func:`dataclasses.asdict` along with optionally excluding any
-        Redis-related (or internal) fields.
+        Return a shallow mapping of field names to values representing this entry, optionally excluding any Redis-related (or internal)
+        fields.
+
+        Unlike :py:func:`dataclasses.asdict`, values are not recursively copied (i.e. nested dataclasses are returned as-is)
 
         By default no internal or redis fields (i.e. ``redis_id`` or ``redis_name``) are returned
 
@@ -158,13 +211,7 @@ class RedisEntry:
         :param include_internal_fields: if set, include internal fields which are used by ``redisent`` only (any marked with metadata attribute ``internal_field``)
         """
 
-        ent_dict = asdict(self)
-
-        if include_redis_fields and include_internal_fields:
-            return ent_dict
-
-        flds = self.get_entry_fields(include_redis_fields=include_redis_fields, include_internal_fields=include_internal_fields)
-        return {attr: value for attr, value in ent_dict.items() if attr in flds}
+        return {attr: getattr(self, attr) for attr in _entry_field_names(type(self), include_redis_fields, include_internal_fields)}
 
     @classmethod
     def decode_entry(cls, entry_bytes, use_redis_id: str = None, use_redis_name: str = None):
@@ -172,45 +219,110 @@ class RedisEntry:
         Class method for attempting to build a :py:class:`redisent.models.RedisEntry` instance from the provided ``bytes``
         value ``entry_bytes``
 
-        Under the hood, this makes use of :py:func:`pickle.loads` and :py:class:`redisent.models.RedisEntry.load_dict` to actually
+        Under the hood, this makes use of :py:func:`redisent.helpers.RedisentHelper.decode_value` (``msgpack``, falling back to
+        :py:func:`pickle.loads` for older or non-``msgpack`` entries) and :py:class:`redisent.models.RedisEntry.load_dict` to actually
         attempt to build the entry while catching any related exceptions and propagating them as :py:exc:`redisent.errors.RedisError`
         exceptions.
         """
 
         try:
-            ent: MutableMapping[str, Any] = pickle.loads(entry_bytes)
+            ent = RedisentHelper.decode_value(entry_bytes)
+        except pickle.PickleError as ex:
+            err_message = f'Error decoding entry using pickle: {ex}'
+            logger.exception(err_message)
+            raise RedisError(err_message, base_exception=ex) from ex
+        except Exception as ex:
+            err_message = f'General error while attempting to decode possible RedisEntry'
+            logger.exception(f'{err_message}: {ex}')
+            raise RedisError(err_message, base_exception=ex) from ex
+
+        return cls._load_decoded(ent, use_redis_id, use_redis_name)
 
-            if isinstance(ent, Mapping):
-                redis_id = ent.pop('redis_id', None)
-                redis_id = use_redis_id or redis_id
+    @classmethod
+    def decode_many(cls, entries_bytes: Iterable[bytes], use_redis_id: str = None, use_redis_names: Iterable[Optional[str]] = None,
+                    use_redis_ids: Iterable[str] = None) -> List[RedisEntry]:
+        """
+        Class method for decoding a batch of ``bytes`` values (such as the results of a pipeline or ``MGET``) into a list of
+        :py:class:`redisent.models.RedisEntry` instances
 
-                if not redis_id:
-                    raise RedisError('Unable to convert dictionary from Redis into RedisEntry (no value for "redis_id" found)')
+        The whole batch is decoded using :py:func:`redisent.helpers.RedisentHelper.decode_values` before each value is loaded
+        the same way as :py:func:`RedisEntry.decode_entry` would. If provided, ``use_redis_ids`` and ``use_redis_names`` are consumed in
+        step with ``entries_bytes`` so each entry can be given the key (and hashmap name) it was fetched from.
 
-                redis_name = ent.pop('redis_name', None)
-                redis_name = use_redis_name or redis_name
+        :param entries_bytes: iterable of encoded entries to decode
+        :param use_redis_id: if provided, the Redis ID to use for every decoded entry
+        :param use_redis_names: if provided, an iterable of Redis hashmap names matching ``entries_bytes`` one-to-one
+        :param use_redis_ids: if provided, an iterable of Redis IDs matching ``entries_bytes`` one-to-one (overrides ``use_redis_id``)
+        """
 
-                return cls.load_dict(redis_id, redis_name=redis_name, **ent)
-            elif not isinstance(ent, RedisEntry):
-                raise RedisError('Decoded entry is neither a dictionary nor a Mapping')
+        entries_bytes = entries_bytes if isinstance(entries_bytes, Sequence) else list(entries_bytes)
 
-            return ent
-        except RedisError as ex:
-            raise ex
-        except pickle.PickleError as ex:
-            err_message = f'Error decoding entry using pickle: {ex}'
-            logger.exception(err_message)
-            raise RedisError(err_message, base_exception=ex)
+        try:
+            ents = RedisentHelper.decode_values(entries_bytes)
         except Exception as ex:
-            err_message = f'General error while attempting to decode possible RedisEntry'
+            err_message = f'Error while attempting to decode {len(entries_bytes)} possible RedisEntry values'
             logger.exception(f'{err_message}: {ex}')
-            raise RedisError(err_message, base_exception=ex)
+            raise RedisError(err_message, base_exception=ex) from ex
+
+        load_decoded = cls._load_decoded
+
+        if use_redis_ids is None and use_redis_names is None:
+            return [load_decoded(ent, use_redis_id) for ent in ents]
+
+        redis_ids = itertools.repeat(use_redis_id) if use_redis_ids is None else use_redis_ids
+        redis_names = itertools.repeat(None) if use_redis_names is None else use_redis_names
+
+        return [load_decoded(ent, redis_id, redis_name) for ent, redis_id, redis_name in zip(ents, redis_ids, redis_names)]
+
+    @classmethod
+    def _load_decoded(cls, ent: Any, use_redis_id: str = None, use_redis_name: str = None) -> RedisEntry:
+        """
+        Internal helper for building a :py:class:`redisent.models.RedisEntry` from an already decoded value (either a mapping of
+        fields or an unpickled entry)
+
+        Any exception raised while building the entry (i.e. from a subclass ``__post_init__``) is propagated as a
+        :py:exc:`redisent.errors.RedisError`
+
+        :param ent: the decoded value
+        :param use_redis_id: if provided, the Redis ID to use for the entry
+        :param use_redis_name: if provided, the Redis hashmap name to use for the entry
+        """
+
+        if isinstance(ent, Mapping):
+            redis_id = ent.pop('redis_id', None)
+            redis_id = use_redis_id or redis_id
+
+            if not redis_id:
+                raise RedisError('Unable to convert dictionary from Redis into RedisEntry (no value for "redis_id" found)')
+
+            redis_name = ent.pop('redis_name', None)
+            redis_name = use_redis_name or redis_name
+
+            try:
+                return cls.load_dict(redis_id, redis_name=redis_name, **ent)
+            except RedisError:
+                raise
+            except Exception as ex:
+                err_message = f'Error while attempting to load decoded RedisEntry for "{redis_id}"'
+                logger.exception(f'{err_message}: {ex}')
+                raise RedisError(err_message, base_exception=ex) from ex
+        elif not isinstance(ent, RedisEntry):
+            raise RedisError('Decoded entry is neither a dictionary nor a Mapping')
+
+        return ent
 
     @classmethod
     def encode_entry(cls, entry: RedisEntry, as_mapping: bool = None) -> bytes:
         """
-        Class method for encoding a given :py:class:`redisent.models.RedisEntry` instance as ``bytes`` using
-        the :py:func:`pickle.dumps` method.
+        Class method for encoding a given :py:class:`redisent.models.RedisEntry` instance as ``bytes``
+
+        Hashmap entries are encoded as a mapping of their fields using :py:func:`redisent.helpers.RedisentHelper.encode_value` (which
+        uses ``msgpack`` whenever the field values allow it). Otherwise the entry itself is encoded using :py:func:`pickle.dumps`. In
+        both cases large results are compressed using :py:func:`redisent.helpers.RedisentHelper.compress_value`.
+
+        The ``redis_id`` and ``redis_name`` of hashmap entries are not part of the encoded mapping since they are already the key and
+        hashmap name the entry is stored under. They must be provided to :py:func:`RedisEntry.decode_entry` (``use_redis_id`` and
+        ``use_redis_name``) when decoding, which all of the ``fetch`` methods do.
 
         :param entry: the :py:class:`redisent.models.RedisEntry` instance to be encoded
         :param as_mapping: if provided, ``entry`` will be treated as a Redis hashmap entry. otherwise, the default behavior
@@ -221,10 +333,15 @@ class RedisEntry:
             as_mapping = True if entry.redis_name else False
 
         try:
-            return pickle.dumps(entry.as_dict(include_redis_fields=True, include_internal_fields=False) if as_mapping is True else entry)
+            if as_mapping is True:
+                entry_bytes = RedisentHelper.encode_value(entry.as_dict(include_redis_fields=False, include_internal_fields=False))
+            else:
+                entry_bytes = RedisentHelper.compress_value(pickle.dumps(entry, protocol=PICKLE_PROTOCOL))
         except Exception as ex:
             ent_str = f' (entry name: "{entry.redis_name}")' if entry.redis_name else ''
-            raise Exception(f'Error encoding entry for "{entry.redis_id}"{ent_str} using pickle: {ex}')
+            raise Exception(f'Error encoding entry for "{entry.redis_id}"{ent_str}: {ex}')
+
+        return entry_bytes
 
     def store_sync(self, helper: RedisentHelper) -> bool:
         """
@@ -303,6 +420,124 @@ class RedisEntry:
 
         return self.store_sync(helper)
 
+    @classmethod
+    def _group_store_entries(cls, entries: Iterable[RedisEntry]) -> Tuple[Dict[str, bytes], Dict[str, Dict[str, bytes]]]:
+        """
+        Internal helper for encoding entries used by the ``store_many_*`` methods, grouped by how they are stored
+
+        Returns a tuple of the encoded non-hashmap entries (keyed by ``redis_id``) and the encoded hashmap entries grouped by their
+        ``redis_id`` (and keyed by ``redis_name``).
+
+        :param entries: iterable of entries to encode
+        """
+
+        plain_entries: Dict[str, bytes] = {}
+        hashmap_entries: Dict[str, Dict[str, bytes]] = {}
+
+        for entry in entries:
+            entry_bytes = cls.encode_entry(entry)
+
+            if entry.redis_name:
+                hashmap_entries.setdefault(entry.redis_id, {})[entry.redis_name] = entry_bytes
+            else:
+                plain_entries[entry.redis_id] = entry_bytes
+
+        return plain_entries, hashmap_entries
+
+    @classmethod
+    def store_many_sync(cls, helper: RedisentHelper, entries: Iterable[RedisEntry]) -> int:
+        """
+        Blocking / synchronous method for storing several entries in Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        The entries are grouped so that all non-hashmap entries are written using a single ``mset`` and the hashmap entries using one
+        ``hset`` per ``redis_id``. These commands are queued on a ``redis`` pipeline (without a transaction) which is then executed
+        at once. Returns the number of entries stored.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.store_many_async` asynchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used for storing the entries
+        :param entries: iterable of entries to store
+        """
+
+        plain_entries, hashmap_entries = cls._group_store_entries(entries)
+        entry_count = len(plain_entries) + sum(len(hashmap) for hashmap in hashmap_entries.values())
+
+        if not entry_count:
+            return 0
+
+        with helper.wrapped_redis(op_name=f'pipeline(mset/hset x {entry_count})') as r_conn:
+            pipe = r_conn.pipeline(transaction=False)
+
+            if plain_entries:
+                pipe.mset(plain_entries)
+
+            for redis_id, hashmap in hashmap_entries.items():
+                pipe.hset(redis_id, mapping=hashmap)
+
+            pipe.execute()
+
+        return entry_count
+
+    @classmethod
+    async def store_many_async(cls, helper: RedisentHelper, entries: Iterable[RedisEntry]) -> int:
+        """
+        asyncio / asynchronous method for storing several entries in Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        The entries are grouped so that all non-hashmap entries are written using a single ``mset`` and the hashmap entries using one
+        ``hmset`` per ``redis_id``. These commands are queued on an ``aioredis`` pipeline which is then executed at once. Returns the
+        number of entries stored.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.store_many_sync` synchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used for storing the entries
+        :param entries: iterable of entries to store
+        """
+
+        plain_entries, hashmap_entries = cls._group_store_entries(entries)
+        entry_count = len(plain_entries) + sum(len(hashmap) for hashmap in hashmap_entries.values())
+
+        if not entry_count:
+            return 0
+
+        async with helper.wrapped_redis(op_name=f'pipeline(mset/hmset x {entry_count})') as r_conn:
+            pipe = r_conn.pipeline()
+
+            if plain_entries:
+                pipe.mset(*itertools.chain.from_iterable(plain_entries.items()))
+
+            for redis_id, hashmap in hashmap_entries.items():
+                pipe.hmset_dict(redis_id, hashmap)
+
+            await pipe.execute()
+
+        return entry_count
+
+    @classmethod
+    def store_many(cls, helper: RedisentHelper, entries: Iterable[RedisEntry]) -> int:
+        """
+        A synchronous / asynchronous agnostic wrapper for storing several entries in Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper`
+
+        The corresponding :py:func:`RedisEntry.store_many_sync` or :py:func:`RedisEntry.store_many_async` will be called as
+        determined be the configured :py:attr:`redisent.helpers.RedisentHelper.redis_pool` type. The same event loop caveats
+        described in :py:func:`RedisEntry.store` apply here.
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used for storing the entries
+        :param entries: iterable of entries to store
+        """
+
+        if helper.is_async:
+            loop = asyncio.get_event_loop_policy().get_event_loop()
+            res = loop.run_until_complete(cls.store_many_async(helper, entries))
+            loop.close()
+            return res
+
+        return cls.store_many_sync(helper, entries)
+
     @classmethod
     def fetch_sync(cls, helper: RedisentHelper, redis_id: str, redis_name: str = None) -> RedisEntry:
         """
@@ -322,15 +557,15 @@ class RedisEntry:
         """
 
         op_name = f'get(key="{redis_id}")' if not redis_name else f'hget(key="{redis_id}", name="{redis_name}")'
-        name_str = f' of entry "{redis_name}"' if redis_name else ''
 
         with helper.wrapped_redis(op_name=op_name) as r_conn:
             entry_bytes = r_conn.get(redis_id) if not redis_name else r_conn.hget(redis_id, redis_name)
 
         if not entry_bytes:
+            name_str = f' of entry "{redis_name}"' if redis_name else ''
             raise RedisError(f'Failure during fetch of key "{redis_id}"{name_str}: No data returned')
 
-        return cls.decode_entry(entry_bytes)
+        return cls.decode_entry(entry_bytes, use_redis_id=redis_id, use_redis_name=redis_name)
 
     @classmethod
     async def fetch_async(cls, helper: RedisentHelper, redis_id: str, redis_name: str = None) -> RedisEntry:
@@ -351,15 +586,15 @@ class RedisEntry:
         """
 
         op_name = f'get(key="{redis_id}")' if not redis_name else f'hget(key="{redis_id}", name="{redis_name}")'
-        name_str = f' of entry "{redis_name}"' if redis_name else ''
 
         async with helper.wrapped_redis(op_name=op_name) as r_conn:
             entry_bytes = await (r_conn.get(redis_id) if not redis_name else r_conn.hget(redis_id, redis_name))
 
         if not entry_bytes:
+            name_str = f' of entry "{redis_name}"' if redis_name else ''
             raise RedisError(f'Failure during fetch of key "{redis_id}"{name_str}: No data returned')
 
-        return cls.decode_entry(entry_bytes)
+        return cls.decode_entry(entry_bytes, use_redis_id=redis_id, use_redis_name=redis_name)
 
     @classmethod
     def fetch(cls, helper: RedisentHelper, redis_id: str, redis_name: str = None) -> RedisEntry:
@@ -396,3 +631,241 @@ class RedisEntry:
             return res
 
         return cls.fetch_sync(helper, redis_id, redis_name=redis_name)
+
+    @classmethod
+    def _build_fetch_keys(cls, redis_ids: Sequence[str], redis_names: Sequence[Optional[str]] = None) -> List[Tuple[str, Optional[str]]]:
+        """
+        Internal helper for pairing up the ``redis_ids`` and optional ``redis_names`` passed to the ``fetch_many_*`` methods
+
+        :param redis_ids: sequence of Redis IDs to fetch
+        :param redis_names: optional sequence of Redis hashmap names matching ``redis_ids`` one-to-one
+        """
+
+        if redis_names is None:
+            return [(redis_id, None) for redis_id in redis_ids]
+
+        if len(redis_names) != len(redis_ids):
+            raise RedisError(f'Unable to fetch entries: got {len(redis_ids)} Redis IDs but {len(redis_names)} hashmap names')
+
+        return list(zip(redis_ids, redis_names))
+
+    @classmethod
+    def _check_fetched_many(cls, fetch_keys: List[Tuple[str, Optional[str]]], entries_bytes: List[bytes]) -> None:
+        """
+        Internal helper for raising a :py:exc:`redisent.errors.RedisError` if any of the entries from a ``fetch_many_*`` call were missing
+
+        :param fetch_keys: list of ``(redis_id, redis_name)`` pairs which were fetched
+        :param entries_bytes: the raw results, in the same order as ``fetch_keys``
+        """
+
+        missing = [f'"{redis_id}"' + (f' (entry "{redis_name}")' if redis_name else '')
+                   for (redis_id, redis_name), entry_bytes in zip(fetch_keys, entries_bytes) if not entry_bytes]
+
+        if missing:
+            raise RedisError(f'Failure during fetch of {len(fetch_keys)} keys: No data returned for {", ".join(missing)}')
+
+    @classmethod
+    def fetch_many_sync(cls, helper: RedisentHelper, redis_ids: Sequence[str], redis_names: Sequence[Optional[str]] = None) -> List[RedisEntry]:
+        """
+        Blocking / synchronous method for fetching several entries from Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        If no ``redis_names`` are provided, the entries are fetched using a single ``mget`` command. Otherwise each ``get`` (or ``hget`` if
+        a hashmap name is provided for that entry) is queued on a non-transactional Redis pipeline which is then executed at once. The
+        results are decoded using :py:func:`RedisEntry.decode_many`.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.fetch_many_async` asynchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_ids: sequence of unique Redis IDs for the entries
+        :param redis_names: optional sequence of Redis hashmap names matching ``redis_ids`` one-to-one (use ``None`` for non-hashmap entries)
+        """
+
+        fetch_keys = cls._build_fetch_keys(redis_ids, redis_names)
+
+        if not fetch_keys:
+            return []
+
+        if redis_names is None:
+            with helper.wrapped_redis(op_name=f'mget(keys x {len(fetch_keys)})') as r_conn:
+                entries_bytes = r_conn.mget(redis_ids)
+
+            cls._check_fetched_many(fetch_keys, entries_bytes)
+            return cls.decode_many(entries_bytes, use_redis_ids=redis_ids)
+
+        with helper.wrapped_redis(op_name=f'pipeline(get/hget x {len(fetch_keys)})') as r_conn:
+            pipe = r_conn.pipeline(transaction=False)
+
+            for redis_id, redis_name in fetch_keys:
+                if redis_name:
+                    pipe.hget(redis_id, redis_name)
+                else:
+                    pipe.get(redis_id)
+
+            entries_bytes = pipe.execute()
+
+        cls._check_fetched_many(fetch_keys, entries_bytes)
+        return cls.decode_many(entries_bytes, use_redis_ids=redis_ids, use_redis_names=redis_names)
+
+    @classmethod
+    async def fetch_many_async(cls, helper: RedisentHelper, redis_ids: Sequence[str], redis_names: Sequence[Optional[str]] = None) -> List[RedisEntry]:
+        """
+        asyncio / asynchronous method for fetching several entries from Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        If no ``redis_names`` are provided, the entries are fetched using a single ``mget`` command. Otherwise each ``get`` (or ``hget`` if
+        a hashmap name is provided for that entry) is queued on an ``aioredis`` pipeline which is then executed at once. The results are
+        decoded using :py:func:`RedisEntry.decode_many`.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.fetch_many_sync` synchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_ids: sequence of unique Redis IDs for the entries
+        :param redis_names: optional sequence of Redis hashmap names matching ``redis_ids`` one-to-one (use ``None`` for non-hashmap entries)
+        """
+
+        fetch_keys = cls._build_fetch_keys(redis_ids, redis_names)
+
+        if not fetch_keys:
+            return []
+
+        if redis_names is None:
+            async with helper.wrapped_redis(op_name=f'mget(keys x {len(fetch_keys)})') as r_conn:
+                entries_bytes = await r_conn.mget(*redis_ids)
+
+            cls._check_fetched_many(fetch_keys, entries_bytes)
+            return cls.decode_many(entries_bytes, use_redis_ids=redis_ids)
+
+        async with helper.wrapped_redis(op_name=f'pipeline(get/hget x {len(fetch_keys)})') as r_conn:
+            pipe = r_conn.pipeline()
+
+            for redis_id, redis_name in fetch_keys:
+                if redis_name:
+                    pipe.hget(redis_id, redis_name)
+                else:
+                    pipe.get(redis_id)
+
+            entries_bytes = await pipe.execute()
+
+        cls._check_fetched_many(fetch_keys, entries_bytes)
+        return cls.decode_many(entries_bytes, use_redis_ids=redis_ids, use_redis_names=redis_names)
+
+    @classmethod
+    def fetch_many(cls, helper: RedisentHelper, redis_ids: Sequence[str], redis_names: Sequence[Optional[str]] = None) -> List[RedisEntry]:
+        """
+        A synchronous / asynchronous agnostic wrapper for fetching several entries from Redis in a single round-trip, using the provided
+        :py:class:`redisent.helpers.RedisentHelper`
+
+        The corresponding :py:func:`RedisEntry.fetch_many_sync` or :py:func:`RedisEntry.fetch_many_async` will be called as
+        determined be the configured :py:attr:`redisent.helpers.RedisentHelper.redis_pool` type. The same event loop caveats
+        described in :py:func:`RedisEntry.fetch` apply here.
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_ids: sequence of unique Redis IDs for the entries
+        :param redis_names: optional sequence of Redis hashmap names matching ``redis_ids`` one-to-one (use ``None`` for non-hashmap entries)
+        """
+
+        if helper.is_async:
+            loop = asyncio.get_event_loop_policy().get_event_loop()
+            res = loop.run_until_complete(cls.fetch_many_async(helper, redis_ids, redis_names=redis_names))
+            loop.close()
+            return res
+
+        return cls.fetch_many_sync(helper, redis_ids, redis_names=redis_names)
+
+    @classmethod
+    def fetch_all_sync(cls, helper: RedisentHelper, redis_id: str, match: str = None) -> Mapping[str, RedisEntry]:
+        """
+        Blocking / synchronous method for fetching every entry stored in a Redis hashmap, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        This method uses ``hgetall`` to fetch all of the hashmap entries at once and decodes them using :py:func:`RedisEntry.decode_many`.
+        If ``match`` is provided, ``hscan`` is used instead so only the entries with a matching hashmap name are sent back by Redis (and
+        decoded). Scanning takes one round-trip per ``HSCAN_COUNT`` (or so) hashmap entries rather than a single one. If the hashmap
+        does not exist, an empty mapping is returned.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.fetch_all_async` asynchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_id: unique Redis ID of the hashmap
+        :param match: optional glob-style pattern (i.e. ``'12345:*'``) the hashmap names must match
+        :returns: mapping of each hashmap name to its decoded entry
+        """
+
+        if match is not None:
+            with helper.wrapped_redis(op_name=f'hscan(key="{redis_id}", match="{match}")') as r_conn:
+                entries_raw = dict(r_conn.hscan_iter(redis_id, match=match, count=HSCAN_COUNT))
+        else:
+            with helper.wrapped_redis(op_name=f'hgetall(key="{redis_id}")') as r_conn:
+                entries_raw = r_conn.hgetall(redis_id)
+
+        return cls._decode_all(redis_id, entries_raw)
+
+    @classmethod
+    async def fetch_all_async(cls, helper: RedisentHelper, redis_id: str, match: str = None) -> Mapping[str, RedisEntry]:
+        """
+        asyncio / asynchronous method for fetching every entry stored in a Redis hashmap, using the provided
+        :py:class:`redisent.helpers.RedisentHelper` instance.
+
+        This method uses ``hgetall`` to fetch all of the hashmap entries at once and decodes them using :py:func:`RedisEntry.decode_many`.
+        If ``match`` is provided, ``hscan`` is used instead so only the entries with a matching hashmap name are sent back by Redis (and
+        decoded). Scanning takes one round-trip per ``HSCAN_COUNT`` (or so) hashmap entries rather than a single one. If the hashmap
+        does not exist, an empty mapping is returned.
+
+        .. seealso::
+           See also the :py:func:`RedisEntry.fetch_all_sync` synchronous method documentation
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_id: unique Redis ID of the hashmap
+        :param match: optional glob-style pattern (i.e. ``'12345:*'``) the hashmap names must match
+        :returns: mapping of each hashmap name to its decoded entry
+        """
+
+        if match is not None:
+            async with helper.wrapped_redis(op_name=f'hscan(key="{redis_id}", match="{match}")') as r_conn:
+                entries_raw = {redis_name: entry_bytes async for redis_name, entry_bytes in r_conn.ihscan(redis_id, match=match, count=HSCAN_COUNT)}
+        else:
+            async with helper.wrapped_redis(op_name=f'hgetall(key="{redis_id}")') as r_conn:
+                entries_raw = await r_conn.hgetall(redis_id)
+
+        return cls._decode_all(redis_id, entries_raw)
+
+    @classmethod
+    def fetch_all(cls, helper: RedisentHelper, redis_id: str, match: str = None) -> Mapping[str, RedisEntry]:
+        """
+        A synchronous / asynchronous agnostic wrapper for fetching every entry stored in a Redis hashmap, using the provided
+        :py:class:`redisent.helpers.RedisentHelper`
+
+        The corresponding :py:func:`RedisEntry.fetch_all_sync` or :py:func:`RedisEntry.fetch_all_async` will be called as
+        determined be the configured :py:attr:`redisent.helpers.RedisentHelper.redis_pool` type. The same event loop caveats
+        described in :py:func:`RedisEntry.fetch` apply here.
+
+        :param helper: configured instance of :py:class:`redisent.helpers.RedisentHelper` to be used to fetch the entries
+        :param redis_id: unique Redis ID of the hashmap
+        :param match: optional glob-style pattern (i.e. ``'12345:*'``) the hashmap names must match
+        :returns: mapping of each hashmap name to its decoded entry
+        """
+
+        if helper.is_async:
+            loop = asyncio.get_event_loop_policy().get_event_loop()
+            res = loop.run_until_complete(cls.fetch_all_async(helper, redis_id, match=match))
+            loop.close()
+            return res
+
+        return cls.fetch_all_sync(helper, redis_id, match=match)
+
+    @classmethod
+    def _decode_all(cls, redis_id: str, entries_raw: Mapping[bytes, bytes]) -> Mapping[str, RedisEntry]:
+        """
+        Internal helper for decoding the raw ``hgetall`` (or ``hscan``) response used by the ``fetch_all_*`` methods
+
+        :param redis_id: unique Redis ID of the hashmap
+        :param entries_raw: mapping of raw hashmap names to encoded entries
+        """
+
+        redis_names = [redis_name.decode('utf-8') for redis_name in entries_raw]
+        return dict(zip(redis_names, cls.decode_many(entries_raw.values(), use_redis_id=redis_id, use_redis_names=redis_names)))
+
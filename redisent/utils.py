@@ -4,9 +4,10 @@ import asyncio
 import aioredis
 import redis
 import logging
+import sys
 
 from contextlib import contextmanager, asynccontextmanager
-from typing import Union
+from typing import Union, Mapping
 
 from redisent import RedisError
 
@@ -16,4 +17,7 @@ logger = logging.getLogger(__name__)
 RedisPoolType = Union[aioredis.ConnectionsPool, redis.ConnectionPool]
 RedisPrimitiveType = Union[int, float, str, bytes]
 
+# Keyword arguments for ``@dataclass`` to drop the per-instance ``__dict__`` where supported (Python 3.10+)
+DATACLASS_SLOTS: Mapping[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 LOG_LEVEL: int = logging.INFO
@@ -1,17 +1,16 @@
-import os.path
+import pathlib
 import setuptools
 
 from redisent import __version__ as redisent_version
 
-req_path = os.path.join(os.path.dirname(__file__), 'requirements.txt')
-with open(req_path, 'rt') as f:
-    install_reqs = [req.rstrip('\n') for req in f.readlines()]
+req_path = pathlib.Path(__file__).parent / 'requirements.txt'
+install_reqs = req_path.read_text().splitlines()
 
 
 setuptools.setup(
     name='redisent',
     version=redisent_version,
-    packages=setuptools.find_packages(where='.'),
+    packages=['redisent'],
     url='https://github.com/jhannah01/redisent',
     license='',
     author='Jon Hannah',
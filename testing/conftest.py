@@ -1,18 +1,62 @@
 import pytest
-import aioredis
+import pytest_asyncio
 
-import fakeredis
-import fakeredis.aioredis
-import redis
 
-pytestmark = [pytest.mark.asyncio]
+@pytest.fixture(scope='session')
+def fake_redis_server():
+    import fakeredis
 
+    return fakeredis.FakeServer()
 
-@pytest.fixture()
-def use_fake_aioredis(mocker):
-    mocker.patch.object(aioredis, 'ConnectionsPool', new=fakeredis.aioredis.FakeConnectionsPool)
 
+@pytest.fixture(scope='session')
+def use_fake_aioredis(fake_redis_server):
+    import aioredis
+    import fakeredis.aioredis
 
-@pytest.fixture()
-def use_fake_redis(mocker):
-    mocker.patch.object(redis, 'StrictRedis', new=fakeredis.FakeStrictRedis)
+    async def create_fake_pool(redis_uri, **kwargs):
+        return await fakeredis.aioredis.create_redis_pool(fake_redis_server, **kwargs)
+
+    # RedisentHelper.build_pool_async() builds its pool using aioredis.create_redis_pool()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(aioredis, 'create_redis_pool', create_fake_pool)
+        yield
+
+
+@pytest.fixture(scope='session')
+def use_fake_redis(fake_redis_server):
+    import redis
+    import fakeredis
+
+    def build_fake_pool(redis_uri, **kwargs):
+        return redis.ConnectionPool(connection_class=fakeredis.FakeConnection, server=fake_redis_server)
+
+    # RedisentHelper.build_pool_sync() builds its pool using redis.ConnectionPool.from_url()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(redis.ConnectionPool, 'from_url', build_fake_pool)
+        yield
+
+
+@pytest.fixture(scope='session')
+def blocking_helper(use_fake_redis):
+    from redisent import RedisentHelper
+
+    pool = RedisentHelper.build_pool_sync(redis_uri='127.0.0.1')
+
+    try:
+        yield RedisentHelper(pool, is_async=False)
+    finally:
+        pool.disconnect()
+
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
+async def async_helper(use_fake_aioredis):
+    from redisent import RedisentHelper
+
+    pool = await RedisentHelper.build_pool_async(redis_uri='redis://127.0.0.1')
+
+    try:
+        yield RedisentHelper(pool, is_async=True)
+    finally:
+        pool.close()
+        await pool.wait_closed()
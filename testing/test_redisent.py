@@ -1,104 +1,95 @@
+import asyncio
+import logging
+import pickle
 import pytest
 
+from dataclasses import dataclass, field
 from datetime import datetime
-from pprint import pformat
 from redisent import RedisentHelper, RedisError, RedisEntry
+from redisent.helpers import MSGPACK_MAGIC, ZLIB_MAGIC
+from redisent.utils import DATACLASS_SLOTS
 
+logger = logging.getLogger(__name__)
 
-@pytest.mark.asyncio
-async def test_async_redis(use_fake_aioredis):
-    r_pool = await RedisentHelper.build_pool_async(redis_uri='redis://localhost')
 
-    try:
-        rh = RedisentHelper(redis_pool=r_pool)
-
-        async with rh.wrapped_redis(op_name='set(blarg, 5.7)') as r_conn:
-            res = await r_conn.set('blarg', 5.7)
-        assert res, f'Bad return from set(): {res}'
-
-        async with rh.wrapped_redis(op_name='exists(blarg)') as r_conn:
-            res = await r_conn.exists('blarg')
-        assert res, f'Key "blarg" did not return True for exists(). Got: {res}'
+@dataclass(**DATACLASS_SLOTS)
+class DummyEntry(RedisEntry):
+    value: float = field(default_factory=float)
 
-        async with rh.wrapped_redis(op_name='get(blarg)') as r_conn:
-            res = float(await r_conn.get('blarg'))
-        assert res == 5.7, f'Fetched value of "blarg" does not match set value (5.7). Got: {res}'
 
-        print(f'Received matching object back:\n{pformat(res, indent=4)}')
+@pytest.mark.asyncio(loop_scope='session')
+async def test_async_redis(async_helper):
+    rh = async_helper
 
-        async with rh.wrapped_redis(op_name='delete(blarg)') as r_conn:
-            res = await r_conn.delete('blarg')
-            assert res > 0, f'Bad return from delete(blarg): {res}'
+    # The "blarg" and "beep" sequences are independent, so run both pipelines concurrently on separate pool connections
+    async with rh.wrapped_redis(op_name='pipeline(set/exists/get/delete blarg) + pipeline(hset/hexists/hget/hdel beep boop)') as r_conn:
+        pipe = r_conn.pipeline()
+        pipe.set('blarg', 5.7)
+        pipe.exists('blarg')
+        pipe.get('blarg')
+        pipe.delete('blarg')
 
-        async with rh.wrapped_redis(op_name='hset("beep", "boop", ...)') as r_conn:
-            res = await r_conn.hset('beep', 'boop', 40.66)
-            assert res, f'Bad return from hset(beep, boop, ...): {res}'
+        hash_pipe = r_conn.pipeline()
+        hash_pipe.hset('beep', 'boop', 40.66)
+        hash_pipe.hexists('beep', 'boop')
+        hash_pipe.hget('beep', 'boop')
+        hash_pipe.hdel('beep', 'boop')
 
-        async with rh.wrapped_redis(op_name='hexists("beep", "boop")') as r_conn:
-            res = await r_conn.hexists('beep', 'boop'),
-            assert res, 'Cannot find hash key for "beep" -> "boop" just created'
+        res, hash_res = await asyncio.gather(pipe.execute(), hash_pipe.execute())
 
-        async with rh.wrapped_redis(op_name='hget("beep", "boop")') as r_conn:
-            res = float(await r_conn.hget('beep', 'boop'))
-            assert res == 40.66, f'Fetched value of "beep" -> "boop" does not match 40.66. Got: {res}'
+    set_res, exists_res, get_res, del_res = res
 
-        async with rh.wrapped_redis(op_name='hdel(beep, boop)') as r_conn:
-            res = await r_conn.hdel('beep', 'boop')
-            assert res > 0, f'Bad return from hdel(beep, boop): {res}'
+    assert set_res, f'Bad return from set(): {set_res}'
+    assert exists_res, f'Key "blarg" did not return True for exists(). Got: {exists_res}'
+    assert float(get_res) == 5.7, f'Fetched value of "blarg" does not match set value (5.7). Got: {get_res}'
+    assert del_res > 0, f'Bad return from delete(blarg): {del_res}'
 
-    finally:
-        if r_pool:
-            r_pool.close()
-            await r_pool.wait_closed()
+    logger.debug('Received matching object back: %r', get_res)
 
+    hset_res, hexists_res, hget_res, hdel_res = hash_res
 
-def test_blocking_redis(use_fake_redis):
-    pool = RedisentHelper.build_pool_sync(redis_uri='redis://localhost')
-    rh = RedisentHelper(pool, is_async=False)
+    assert hset_res, f'Bad return from hset(beep, boop, ...): {hset_res}'
+    assert hexists_res, 'Cannot find hash key for "beep" -> "boop" just created'
+    assert float(hget_res) == 40.66, f'Fetched value of "beep" -> "boop" does not match 40.66. Got: {hget_res}'
+    assert hdel_res > 0, f'Bad return from hdel(beep, boop): {hdel_res}'
 
-    with rh.wrapped_redis(op_name='set(blarg=5.7)') as r_conn:
-        res = r_conn.set('blarg', 5.7)
-    assert res, f'Bad return from set(): {res}'
 
-    with rh.wrapped_redis(op_name='exists(blarg)') as r_conn:
-        res = r_conn.exists('blarg')
-    assert res, 'Set key "blarg" but not found after setting.'
+def test_blocking_redis(blocking_helper):
+    rh = blocking_helper
 
-    with rh.wrapped_redis(op_name='keys(*)') as r_conn:
-        res = [val.decode('utf-8') for val in r_conn.keys('*')]
-    assert res, 'No keys returned.'
-    assert 'blarg' in res, f'Could not find set key "blarg" in keys. Got: {res}'
+    with rh.wrapped_redis(op_name='pipeline(set/exists/get/delete blarg)') as r_conn:
+        pipe = r_conn.pipeline(transaction=False)
+        pipe.set('blarg', 5.7)
+        pipe.exists('blarg')
+        pipe.get('blarg')
+        pipe.delete('blarg')
+        set_res, exists_res, get_res, del_res = pipe.execute()
 
-    with rh.wrapped_redis(op_name='get(blarg)') as r_conn:
-        res = float(r_conn.get('blarg'))
-    assert res == 5.7, f'Fetched value of "blarg" does not match set value (5.7). Got: {res}'
+    assert set_res, f'Bad return from set(): {set_res}'
+    assert exists_res, 'Set key "blarg" but not found after setting.'
 
-    print(f'Received matching object back\n{pformat(res, indent=4)}')
+    assert float(get_res) == 5.7, f'Fetched value of "blarg" does not match set value (5.7). Got: {get_res}'
+    assert del_res > 0, f'Bad return from delete(): {del_res}'
 
-    with rh.wrapped_redis(op_name='delete(blarg)') as r_conn:
-        res = r_conn.delete('blarg')
-    assert res > 0, f'Bad return from delete(): {res}'
+    logger.debug('Received matching object back: %r', get_res)
 
-    print('All regular tests complete')
+    with rh.wrapped_redis(op_name='pipeline(hset/hexists/hkeys/hget beep boop)') as r_conn:
+        pipe = r_conn.pipeline(transaction=False)
+        pipe.hset('beep', 'boop', 40.66)
+        pipe.hexists('beep', 'boop')
+        pipe.hkeys('beep')
+        pipe.hget('beep', 'boop')
+        hset_res, hexists_res, hkeys_res, hget_res = pipe.execute()
 
-    with rh.wrapped_redis(op_name='hset(beep, boop, ...)') as r_conn:
-        res = r_conn.hset('beep', 'boop', 40.66)
-        assert res, f'Bad return from hset(beep, boop, ...): {res}'
+    assert hset_res, f'Bad return from hset(beep, boop, ...): {hset_res}'
+    assert hexists_res, 'Set hash entry "boop" in key "beep" not found after setting.'
 
-    with rh.wrapped_redis(op_name='hexists(beep, boop)') as r_conn:
-        res = r_conn.hexists('beep', 'boop')
-    assert res, 'Set hash entry "boop" in key "beep" not found after setting.'
+    assert hkeys_res, 'No hkeys returned for "beep".'
+    assert b'boop' in hkeys_res, f'Could not find hash entry "boop" in key "beep". Got: {hkeys_res}'
 
-    with rh.wrapped_redis(op_name='hkeys(beep)') as r_conn:
-        res = [val.decode('utf-8') for val in r_conn.hkeys('beep')]
-    assert res, 'No hkeys returned for "beep".'
-    assert 'boop' in res, f'Could not find hash entry "boop" in key "beep". Got: {res}'
+    assert float(hget_res) == 40.66, f'Fetched value of "boop" from key "beep" does not match set value (40.66). Got: {hget_res}'
 
-    with rh.wrapped_redis(op_name='hget(beep, boop)') as r_conn:
-        res = float(r_conn.hget('beep', 'boop'))
-    assert res == 40.66, f'Fetched value of "boop" from key "beep" does not match set value (40.66). Got: {res}'
-
-    print(f'Received matching hash entry "boop" from key "beep" back\n{pformat(res, indent=4)}')
+    logger.debug('Received matching hash entry "boop" from key "beep" back: %r', hget_res)
 
     @rh.decode_entries(first_handler=lambda res: {k.decode('utf-8'): float(v) for k, v in res.items()})
     def get_all():
@@ -109,28 +100,24 @@ def test_blocking_redis(use_fake_redis):
     assert 'boop' in all_ents, f'Missing "boop" entry in hgetall keys: "{all_ents.keys()}"'
     assert all_ents == {'boop': 40.66}, f'Expected single dictionary entry in hgetall result. Got: {all_ents}'
 
-    print(f'Received full hash entry for "beep":\n{pformat(all_ents, indent=4)}')
+    logger.debug('Received full hash entry for "beep": %r', all_ents)
 
     with rh.wrapped_redis(op_name='hdel(beep, boop)') as r_conn:
         res = r_conn.hdel('beep', 'boop')
     assert res > 0, f'Bad return from hdel(beep, boop): {res}'
 
-    print('All hash tests complete')
-
 
-def test_bad_sync_redis_value(use_fake_redis):
-    r_pool = RedisentHelper.build_pool_sync(redis_uri='localhost')
-    rh = RedisentHelper(r_pool, is_async=False)
+def test_bad_sync_redis_value(blocking_helper):
+    rh = blocking_helper
 
     with pytest.raises(RedisError):
         with rh.wrapped_redis(op_name='set(bad_val, ...)') as r_conn:
             r_conn.set('bad_val', {'one': 1, 'oh_no': datetime.now()})
 
 
-@pytest.mark.asyncio
-async def test_bad_async_redis_value(use_fake_aioredis):
-    r_pool = await RedisentHelper.build_pool_async(redis_uri='redis://localhost')
-    rh = RedisentHelper(r_pool)
+@pytest.mark.asyncio(loop_scope='session')
+async def test_bad_async_redis_value(async_helper):
+    rh = async_helper
 
     try:
         async with rh.wrapped_redis(op_name='set(bad_val, ...)') as r_conn:
@@ -152,3 +139,117 @@ def test_redis_error():
         print(f'Dumping Exception:\n{ex.dump()}')
     except Exception as ex:
         pytest.fail(f'Received un-expected exception instead of "RedisError": {ex}', True)
+
+
+def test_encode_decode_value():
+    dt_now = datetime.now()
+
+    for value in ({'one': 1, 'two': [2.0, 'two', b'two'], 'none': None}, 'blarg', 5.7, (1, 2), {'one': 1, 'oh_no': dt_now}):
+        value_bytes = RedisentHelper.encode_value(value)
+        assert isinstance(value_bytes, bytes), f'Expected bytes back from encode_value(). Got: {value_bytes}'
+
+        res = RedisentHelper.decode_value(value_bytes)
+        assert res == value, f'Decoded value does not match encoded value "{value}". Got: {res}'
+        assert type(res) is type(value), f'Decoded value type "{type(res)}" does not match "{type(value)}"'
+
+    assert RedisentHelper.encode_value(5.7).startswith(MSGPACK_MAGIC), 'Expected msgpack encoding for a float'
+    assert not RedisentHelper.encode_value((1, 2)).startswith(MSGPACK_MAGIC), 'Expected pickle fallback for a tuple'
+
+    big_values = ['blarg' * 1000, ('blarg',) * 1000]
+    for value in big_values:
+        value_bytes = RedisentHelper.encode_value(value)
+        assert value_bytes.startswith(ZLIB_MAGIC), f'Expected zlib compression for a large {type(value)} value'
+        assert RedisentHelper.decode_value(value_bytes) == value, f'Decoded compressed {type(value)} value does not match'
+
+    res = RedisentHelper.handle_decode_attempt([RedisentHelper.encode_value(value) for value in big_values])
+    assert res == big_values, 'Unexpected result decoding compressed values'
+
+    values = [{'one': 1}, 'blarg', 5.7, None]
+    res = RedisentHelper.decode_values([RedisentHelper.encode_value(value) for value in values])
+    assert res == values, f'Batch-decoded msgpack values do not match. Got: {res}'
+
+    res = RedisentHelper.decode_values([RedisentHelper.encode_value(value) for value in values + [(1, 2)] + big_values])
+    assert res == values + [(1, 2)] + big_values, 'Batch-decoded mixed msgpack / pickle / compressed values do not match'
+
+    with pytest.raises(ValueError):
+        RedisentHelper.decode_values([MSGPACK_MAGIC + b'\x92\x01'])
+
+    with pytest.raises(ValueError):
+        RedisentHelper.decode_values([MSGPACK_MAGIC + b'\x92\x01', MSGPACK_MAGIC + b'\x02\x03'])
+
+    res = RedisentHelper.handle_decode_attempt([RedisentHelper.encode_value(5.7), pickle.dumps(40.66), b'beep'], use_encoding='utf-8')
+    assert res == [5.7, 40.66, 'beep'], f'Unexpected result decoding mixed msgpack / pickle / string values. Got: {res}'
+
+
+def test_encode_decode_entry():
+    ent = DummyEntry(redis_id='dummy', redis_name='cached', value=1.5)
+
+    ent_bytes = DummyEntry.encode_entry(ent)
+    assert RedisentHelper.decode_value(ent_bytes) == {'value': 1.5}, 'Expected only entry fields in the encoded hashmap payload'
+
+    res = DummyEntry.decode_entry(ent_bytes, use_redis_id='dummy', use_redis_name='cached')
+    assert res == ent, f'Expected decoded hashmap entry to match. Got: {res}'
+
+    ent.redis_name = ''
+    res = DummyEntry.decode_entry(DummyEntry.encode_entry(ent))
+    assert res == ent, f'Expected pickled entry after clearing "redis_name" to match. Got: {res}'
+
+
+def test_decode_entry_load_error():
+    @dataclass(**DATACLASS_SLOTS)
+    class StrictEntry(RedisEntry):
+        value: float = field(default_factory=float)
+
+        def __post_init__(self):
+            if self.value < 0:
+                raise ValueError(f'Negative value: {self.value}')
+
+    ent_bytes = pickle.dumps({'redis_id': 'strict', 'redis_name': 'negative', 'value': -1.0})
+
+    with pytest.raises(RedisError) as exc_info:
+        StrictEntry.decode_entry(ent_bytes)
+    assert isinstance(exc_info.value.__cause__, ValueError), f'Expected ValueError as the cause. Got: {exc_info.value.__cause__}'
+
+    with pytest.raises(RedisError):
+        StrictEntry.decode_many([RedisentHelper.encode_value({'value': 1.0}), ent_bytes], use_redis_id='strict')
+
+
+def test_blocking_fetch_many_entries(blocking_helper):
+    rh = blocking_helper
+    ents = [DummyEntry(redis_id=f'dummy_{idx}', value=idx * 1.5) for idx in range(3)]
+
+    for ent in ents:
+        assert ent.store(rh), f'Bad return from store() for "{ent.redis_id}"'
+
+    ent_ids = [ent.redis_id for ent in ents]
+    ents_fetched = DummyEntry.fetch_many(rh, ent_ids)
+    assert ents_fetched == ents, f'Fetched entries do not match originals.\nFetched: {ents_fetched}\nCreated: {ents}'
+
+    with pytest.raises(RedisError):
+        DummyEntry.fetch_many(rh, ent_ids + ['dummy_missing'])
+
+    with rh.wrapped_redis(op_name='delete(dummy_*)') as r_conn:
+        res = r_conn.delete(*ent_ids)
+    assert res == len(ents), f'Bad return from delete({ent_ids}): {res}'
+
+
+def test_blocking_store_many_entries(blocking_helper):
+    rh = blocking_helper
+    plain_ents = [DummyEntry(redis_id=f'dummy_{idx}', value=idx * 1.5) for idx in range(3)]
+    hash_ents = [DummyEntry(redis_id='dummy_hash', redis_name=f'entry_{idx}', value=idx * 2.5) for idx in range(3)]
+
+    assert DummyEntry.store_many(rh, []) == 0, 'Expected nothing stored for an empty list of entries'
+
+    res = DummyEntry.store_many(rh, plain_ents + hash_ents)
+    assert res == len(plain_ents) + len(hash_ents), f'Bad return from store_many(): {res}'
+
+    ent_ids = [ent.redis_id for ent in plain_ents]
+    ents_fetched = DummyEntry.fetch_many(rh, ent_ids)
+    assert ents_fetched == plain_ents, f'Fetched entries do not match originals.\nFetched: {ents_fetched}\nCreated: {plain_ents}'
+
+    ents_all = DummyEntry.fetch_all(rh, 'dummy_hash')
+    assert ents_all == {ent.redis_name: ent for ent in hash_ents}, f'Fetched hashmap entries do not match originals. Got: {ents_all}'
+
+    with rh.wrapped_redis(op_name='delete(dummy_*)') as r_conn:
+        res = r_conn.delete(*ent_ids, 'dummy_hash')
+    assert res == len(ent_ids) + 1, f'Bad return from delete({ent_ids}, dummy_hash): {res}'
@@ -1,15 +1,18 @@
-import aioredis
+import logging
+import pickle
 
 import pytest
-import fakeredis.aioredis
 
 from datetime import datetime, timedelta
 
-from redisent.helpers import RedisentHelper
+from redisent.errors import RedisError
+from redisent.helpers import MSGPACK_MAGIC
 
 # Symlinked from ../examples/reminder.py
 from reminder import Reminder
 
+logger = logging.getLogger(__name__)
+
 
 def build_reminder(use_dt: datetime = None, num_minutes: int = 5, created_ts: float = None) -> Reminder:
     use_dt = use_dt or datetime.now()
@@ -26,54 +29,135 @@ def build_reminder(use_dt: datetime = None, num_minutes: int = 5, created_ts: fl
     return Reminder(**rem_kwargs)
 
 
-@pytest.mark.asyncio
-async def test_async_store_reminder(use_fake_aioredis):
+@pytest.mark.asyncio(loop_scope='session')
+async def test_async_store_reminder(async_helper):
+    rh = async_helper
     rem = build_reminder()
+    rem_name = rem.redis_name
+
+    # hset only returns 1 when the hashmap entry did not already exist, so this also covers checking for an existing reminder
+    res = await rem.store_async(rh)
+    assert res > 0, f'Bad return value for store(): {res} (should be > 0)'
+
+    rem_fetched = await Reminder.fetch_async(helper=rh, redis_id='reminders', redis_name=rem_name)
+    assert rem_fetched, f'No response back fetching "reminder" entry for "{rem_name}". Got: {rem_fetched}'
+
+    assert rem == rem_fetched, f'Fetched entry does not match original.\nFetched:\n{rem_fetched.dump()}\nCreated:\n{rem.dump()}'
+
+    async with rh.wrapped_redis(op_name=f'hdel("reminders", "{rem_name}")') as r_conn:
+        res = await r_conn.hdel('reminders', rem_name)
+        assert res, f'Bad return from hdel of "{rem_name}" in "reminders" Redis key. Got: {res}'
 
-    r_pool = await RedisentHelper.build_pool_async(redis_uri='redis://localhost')
 
-    try:
-        rh = RedisentHelper(r_pool, is_async=True)
+def test_blocking_store_reminder(blocking_helper):
+    rh = blocking_helper
+    rem = build_reminder()
+    rem_name = rem.redis_name
 
-        async with rh.wrapped_redis(op_name=f'hexists("reminders", "{rem.redis_name}")') as r_conn:
-            res = await r_conn.hexists('reminders', rem.redis_name)
-            assert not res, f'Found unexpected, existing key for reminder "{rem.redis_name}" in Redis key "reminders"'
+    # hset only returns 1 when the hashmap entry did not already exist, so this also covers checking for an existing reminder
+    res = rem.store(rh)
+    assert res > 0, f'Bad return value for store(): {res} (should be > 0)'
 
+    rem_fetched = Reminder.fetch(helper=rh, redis_id='reminders', redis_name=rem_name)
+    assert rem_fetched, f'No response back fetching "reminder" entry for "{rem_name}". Got: {rem_fetched}'
+
+    assert rem == rem_fetched, f'Fetched entry does not match original.\nFetched:\n{rem_fetched.dump()}\nCreated:\n{rem.dump()}'
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f'Successfully retrieved Reminder entry back. Dump:\n{rem.dump()}')
+
+    with rh.wrapped_redis(op_name=f'pipeline(hget/hdel "reminders", "{rem_name}")') as r_conn:
+        pipe = r_conn.pipeline(transaction=False)
+        pipe.hget('reminders', rem_name)
+        pipe.hdel('reminders', rem_name)
+        hget_res, hdel_res = pipe.execute()
+
+    assert hget_res.startswith(MSGPACK_MAGIC), f'Expected stored reminder to be encoded with msgpack. Got: {hget_res}'
+    assert hdel_res, f'Bad return from hdel of "{rem_name}" in "reminders" Redis key. Got: {hdel_res}'
+
+
+@pytest.mark.asyncio(loop_scope='session')
+async def test_async_fetch_many_reminders(async_helper):
+    rh = async_helper
+    rems = [build_reminder(num_minutes=num_minutes) for num_minutes in (5, 10, 15)]
+
+    for rem in rems:
         res = await rem.store_async(rh)
         assert res > 0, f'Bad return value for store(): {res} (should be > 0)'
 
-        rem_fetched = await Reminder.fetch_async(helper=rh, redis_id='reminders', redis_name=rem.redis_name)
-        assert rem_fetched, f'No response back fetching "reminder" entry for "{rem.redis_name}". Got: {rem_fetched}'
+    rem_names = [rem.redis_name for rem in rems]
+    rems_fetched = await Reminder.fetch_many_async(helper=rh, redis_ids=['reminders'] * len(rems), redis_names=rem_names)
+    assert rems_fetched == rems, f'Fetched entries do not match originals.\nFetched: {rems_fetched}\nCreated: {rems}'
 
-        assert rem == rem_fetched, f'Fetched entry does not match original.\nFetched:\n{rem_fetched.dump()}\nCreated:\n{rem.dump()}'
+    with pytest.raises(RedisError):
+        await Reminder.fetch_many_async(helper=rh, redis_ids=['reminders', 'reminders'], redis_names=[rem_names[0], 'missing'])
 
-        async with rh.wrapped_redis(op_name=f'hdel("reminders", "{rem.redis_name}")') as r_conn:
-            res = await r_conn.hdel('reminders', rem.redis_name)
-            assert res, f'Bad return from hdel of "{rem.redis_name}" in "reminders" Redis key. Got: {res}'
-    finally:
-        if r_pool:
-            r_pool.close()
-            await r_pool.wait_closed()
+    rems_all = await Reminder.fetch_all_async(helper=rh, redis_id='reminders')
+    assert rems_all == dict(zip(rem_names, rems)), f'Fetched hashmap entries do not match originals.\nFetched: {rems_all}\nCreated: {rems}'
 
-def test_blocking_store_reminder(use_fake_redis):
-    pool = RedisentHelper.build_pool_sync(redis_uri='localhost')
-    rh = RedisentHelper(pool)
-    rem = build_reminder()
+    rems_matched = await Reminder.fetch_all_async(helper=rh, redis_id='reminders', match=f'{rem_names[0]}*')
+    assert rems_matched == {rem_names[0]: rems[0]}, f'Expected only reminder "{rem_names[0]}" back. Got: {rems_matched}'
 
-    with rh.wrapped_redis(op_name=f'hexists("reminders", "{rem.redis_name}")') as r_conn:
-        res = r_conn.hexists('reminders', rem.redis_name)
-        assert not res, f'Found unexpected, existing key for reminder "{rem.redis_name}" in Redis key "reminders"'
+    async with rh.wrapped_redis(op_name='hdel("reminders", ...)') as r_conn:
+        res = await r_conn.hdel('reminders', *rem_names)
+        assert res == len(rems), f'Bad return from hdel of {rem_names} in "reminders" Redis key. Got: {res}'
 
-    res = rem.store(rh)
-    assert res > 0, f'Bad return value for store(): {res} (should be > 0)'
 
-    rem_fetched = Reminder.fetch(helper=rh, redis_id='reminders', redis_name=rem.redis_name)
-    assert rem_fetched, f'No response back fetching "reminder" entry for "{rem.redis_name}". Got: {rem_fetched}'
+def test_blocking_fetch_many_reminders(blocking_helper):
+    rh = blocking_helper
+    rems = [build_reminder(num_minutes=num_minutes) for num_minutes in (5, 10, 15)]
 
-    assert rem == rem_fetched, f'Fetched entry does not match original.\nFetched:\n{rem_fetched.dump()}\nCreated:\n{rem.dump()}'
+    for rem in rems:
+        res = rem.store(rh)
+        assert res > 0, f'Bad return value for store(): {res} (should be > 0)'
+
+    rem_names = [rem.redis_name for rem in rems]
+    rems_fetched = Reminder.fetch_many(helper=rh, redis_ids=['reminders'] * len(rems), redis_names=rem_names)
+    assert rems_fetched == rems, f'Fetched entries do not match originals.\nFetched: {rems_fetched}\nCreated: {rems}'
+
+    with pytest.raises(RedisError):
+        Reminder.fetch_many(helper=rh, redis_ids=['reminders'], redis_names=rem_names)
+
+    rems_all = Reminder.fetch_all(helper=rh, redis_id='reminders')
+    assert rems_all == dict(zip(rem_names, rems)), f'Fetched hashmap entries do not match originals.\nFetched: {rems_all}\nCreated: {rems}'
+
+    assert Reminder.fetch_all(helper=rh, redis_id='missing_reminders') == {}, 'Expected no entries back for a missing hashmap'
+
+    other_rem = Reminder(redis_id='reminders', member_id=54321, provided_when='in 5 minutes', content='other member reminder')
+    assert other_rem.store(rh), f'Bad return from store() for "{other_rem.redis_name}"'
+
+    rems_matched = Reminder.fetch_all(helper=rh, redis_id='reminders', match='12345:*')
+    assert rems_matched == dict(zip(rem_names, rems)), f'Expected only reminders for member "12345" back. Got: {rems_matched}'
 
-    print(f'Successfully retrieved Reminder entry back. Dump:\n{rem.dump()}')
+    rem_names.append(other_rem.redis_name)
+    rems.append(other_rem)
+
+    with rh.wrapped_redis(op_name='hdel("reminders", ...)') as r_conn:
+        res = r_conn.hdel('reminders', *rem_names)
+        assert res == len(rems), f'Bad return from hdel of {rem_names} in "reminders" Redis key. Got: {res}'
+
+
+@pytest.mark.asyncio(loop_scope='session')
+@pytest.mark.parametrize('num_rems', [1, 100])
+async def test_async_store_many_reminders(async_helper, num_rems):
+    rh = async_helper
+    use_dt = datetime.now()
+    rems = [build_reminder(use_dt=use_dt, num_minutes=num_minutes) for num_minutes in range(1, num_rems + 1)]
+
+    res = await Reminder.store_many_async(rh, rems)
+    assert res == num_rems, f'Bad return from store_many_async(): {res} (should be {num_rems})'
+
+    rem_names = [rem.redis_name for rem in rems]
+    rems_all = await Reminder.fetch_all_async(helper=rh, redis_id='reminders')
+    assert rems_all == dict(zip(rem_names, rems)), f'Fetched hashmap entries do not match the {num_rems} stored reminders'
+
+    async with rh.wrapped_redis(op_name='hdel("reminders", ...)') as r_conn:
+        res = await r_conn.hdel('reminders', *rem_names)
+        assert res == num_rems, f'Bad return from hdel of {num_rems} reminders in "reminders" Redis key. Got: {res}'
+
+
+def test_decode_pickled_reminder():
+    rem = build_reminder()
 
-    with rh.wrapped_redis(op_name=f'hdel("reminders", "{rem.redis_name}")') as r_conn:
-        res = r_conn.hdel('reminders', rem.redis_name)
-        assert res, f'Bad return from hdel of "{rem.redis_name}" in "reminders" Redis key. Got: {res}'
+    rem_decoded = Reminder.decode_entry(pickle.dumps(rem.as_dict(include_redis_fields=True)))
+    assert rem == rem_decoded, f'Entry decoded from pickled mapping does not match original.\nDecoded:\n{rem_decoded.dump()}\nCreated:\n{rem.dump()}'